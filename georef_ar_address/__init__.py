@@ -7,5 +7,6 @@ Define las variables que deberían imortarse al importar el módulo
 
 from .address_parser import AddressParser
 from .address_data import ADDRESS_TYPES, AddressData
+from .lru_cache import LRUCache
 
-__all__ = ['AddressParser', 'AddressData', 'ADDRESS_TYPES']
+__all__ = ['AddressParser', 'AddressData', 'ADDRESS_TYPES', 'LRUCache']
@@ -10,6 +10,26 @@ import re
 
 ADDRESS_TYPES = ['simple', 'intersection', 'between']
 
+_FLOAT_REGEXP = re.compile(r'\d+[,.]\d+')
+"""_sre.SRE_Pattern: Expresión regular utilizada para leer alturas con valores
+decimales.
+"""
+
+_INT_REGEXP = re.compile(r'\d+')
+"""_sre.SRE_Pattern: Expresión regular utilizada para leer alturas con valores
+enteros.
+"""
+
+_KM_REGEXP = re.compile(r'km|kil(o|ó)metro', re.IGNORECASE)
+"""_sre.SRE_Pattern: Expresión regular utilizada para detectar alturas con
+unidad en kilómetros.
+"""
+
+_UNSET = object()
+"""object: Valor utilizado para indicar que un atributo de AddressData
+todavía no fue calculado (ya que 'None' es un valor válido).
+"""
+
 
 class AddressData:
     """Contiene las componentes de una dirección, luego de ser extraídas
@@ -21,6 +41,12 @@ class AddressData:
         _door_number_value (str): Valor de la altura de la dirección.
         _door_number_unit (str): Unidad de la altura de la dirección.
         _floor (str): Piso de la dirección.
+        _normalized_door_number_value (int, float, NoneType): Valor numérico
+            de la altura, calculado la primera vez que se lo solicita ('_UNSET'
+            hasta ese momento).
+        _normalized_door_number_unit (str, NoneType): Unidad normalizada de la
+            altura, calculada la primera vez que se la solicita ('_UNSET'
+            hasta ese momento).
 
     """
 
@@ -29,7 +55,9 @@ class AddressData:
         '_street_names',
         '_door_number_value',
         '_door_number_unit',
-        '_floor'
+        '_floor',
+        '_normalized_door_number_value',
+        '_normalized_door_number_unit'
     ]
 
     def __init__(self, address_type, street_names=None, door_number=None,
@@ -56,6 +84,8 @@ class AddressData:
         self._door_number_value = door_number[0] if door_number else None
         self._door_number_unit = door_number[1] if door_number else None
         self._floor = floor
+        self._normalized_door_number_value = _UNSET
+        self._normalized_door_number_unit = _UNSET
 
     def to_dict(self):
         """Devuelve una representación del objeto en forma de diccionario. Útil
@@ -100,6 +130,21 @@ class AddressData:
         "43.5" -> 43.5  (float)
         "S/N"  -> None
 
+        Returns:
+            int, float, NoneType: Valor numérico de la dirección si es posible
+                leerlo, None en caso contrario.
+
+        """
+        if self._normalized_door_number_value is _UNSET:
+            self._normalized_door_number_value = \
+                self._read_door_number_value()
+
+        return self._normalized_door_number_value
+
+    def _read_door_number_value(self):
+        """Lee el valor numérico de la altura de la dirección. Ver
+        'normalized_door_number_value()'.
+
         Returns:
             int, float, NoneType: Valor numérico de la dirección si es posible
                 leerlo, None en caso contrario.
@@ -108,13 +153,16 @@ class AddressData:
         if not self._door_number_value:
             return None
 
-        # Intentar leer un float:
-        match = re.search(r'\d+[,.]\d+', self._door_number_value)
-        if match:
-            return float(match.group(0).replace(',', '.'))
+        value = self._door_number_value
+
+        # Intentar leer un float (solo si el valor contiene un separador):
+        if '.' in value or ',' in value:
+            match = _FLOAT_REGEXP.search(value)
+            if match:
+                return float(match.group(0).replace(',', '.'))
 
         # Intentar leer un int:
-        match = re.search(r'\d+', self._door_number_value)
+        match = _INT_REGEXP.search(value)
         return int(match.group(0)) if match else None
 
     def normalized_door_number_unit(self):
@@ -126,6 +174,19 @@ class AddressData:
             etc.
         - 'km': Kilómetros.
 
+        Returns:
+            None, str: Unidad normalizada de la altura.
+
+        """
+        if self._normalized_door_number_unit is _UNSET:
+            self._normalized_door_number_unit = self._read_door_number_unit()
+
+        return self._normalized_door_number_unit
+
+    def _read_door_number_unit(self):
+        """Lee la unidad normalizada de la altura de la dirección. Ver
+        'normalized_door_number_unit()'.
+
         Returns:
             None, str: Unidad normalizada de la altura.
 
@@ -133,8 +194,7 @@ class AddressData:
         if not self._door_number_unit:
             return None
 
-        if re.search(r'km|kil(o|ó)metro', self._door_number_unit,
-                     re.IGNORECASE):
+        if _KM_REGEXP.search(self._door_number_unit):
             return 'km'
 
         return None
@@ -189,5 +249,13 @@ class AddressData:
         """
         return self._floor
 
+    def __reduce__(self):
+        # Reconstruir el objeto utilizando '__init__' al utilizar 'pickle' o
+        # 'copy', ya que '_UNSET' no conserva su identidad al ser copiado.
+        return self.__class__, (self._type, self._street_names,
+                                (self._door_number_value,
+                                 self._door_number_unit),
+                                self._floor)
+
     def __repr__(self):
         return 'AddressData({})'.format(self.to_dict())
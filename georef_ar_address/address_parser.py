@@ -11,16 +11,26 @@ docs/design.md.
 
 import re
 import os
-import nltk
+import threading
+import concurrent.futures
 from .address_data import AddressData
+from . import grammar
 
 _GRAMMARS_DIR = os.path.join(os.path.dirname(__file__), 'grammars')
 _GRAMMAR_PATH = os.path.join(_GRAMMARS_DIR, 'address-ar.cfg')
 _START_PRODUCTION = 'address'
 
-_SEPARATION_REGEXP = r'([^\W\d]{2,}\.?)(\d)'
+_SEPARATION_REGEXP = (
+    r'(?<![^\W\d])(?P<sep_letters>((?![vb][ºª])[^\W\d]){2,}\.?)'
+    r'(?P<sep_digit>\d)'
+)
 """str: Expresión regular utilizada en la etapa de normalización para separar
-letras seguidas de números.
+letras seguidas de números. Los grupos 'sep_letters' y 'sep_digit' son
+utilizados para reconstruir el texto con un espacio entre ambas partes. Como
+'º' y 'ª' son considerados letras, se evita incluir en las letras el comienzo
+de una información de localidad (por ejemplo, 'Bº'), que debe ser removida en
+su lugar. Las coincidencias solo pueden comenzar al principio de una palabra,
+para evitar reintentar la búsqueda desde cada una de sus letras.
 """
 
 _NORMALIZATION_REGEXPS = [
@@ -49,138 +59,343 @@ importante.
 """
 
 _TOKEN_TYPES = [
-    ('AND_WORD', r'y\s(?=\D)|e\s(?=h?[iy])'),
-    ('AND_NUM', r'y\s(?=\d)'),
-    ('OF', r'de\s'),
-    ('FLOOR', r'piso(\s|$)'),
-    ('DOOR_TYPE', r'(d(e?p)?to\.?|departamento|oficina|of\.)\s'),
-    ('GROUNDL', r'(p\.?b\.?|planta\sbaja)(\s|$)'),
-    ('ISCT_SEP', r'esquina|esq\.|esq\s|esq/'),
+    ('WS', r'\s'),
+    ('AND_WORD', r'y(?=\s\D)|e(?=\sh?[iy])'),
+    ('AND_NUM', r'y(?=\s\d)'),
+    ('OF', r'de(?=\s)'),
+    ('FLOOR', r'piso(?=\s|$)'),
+    ('DOOR_TYPE', r'(d(e?p)?to\.?|departamento|oficina|of\.)(?=\s)'),
+    ('GROUNDL', r'(p\.?b\.?|planta\sbaja)(?=\s|$)'),
+    ('ISCT_SEP', r'esquina|esq\.|esq(?=\s)|esq/'),
     ('BTWN_SEP', r'e/(calles)?|entre\scalles'),
-    ('BETWEEN', r'entre\s'),
+    ('BETWEEN', r'entre(?=\s)'),
     ('KM', r'kil[oó]metro|km\.?'),
     ('MISSING_NAME', r's/nombre'),
     ('MISSING_NUM', r'(sin\s|s/)(n[uú]mero|n(ro\.?|[°º]))'),
-    ('S_N', r's[/-]n|s\s?n(\s|$)'),
-    ('STREET_TYPE_S', r'(avda|av|bv|diag|pje)[\s.]'),
-    ('STREET_TYPE_L', r'calle\s|avenida|bo?ulevard?|diagonal|pasaje'),
-    ('ROUTE', r'ruta|(rta|rn|rp)[\s.]'),
+    ('S_N', r's[/-]n|s\s?n(?=\s|$)'),
+    ('STREET_TYPE_S', r'(avda|av|bv|diag|pje)(\.|(?=\s))'),
+    ('STREET_TYPE_L', r'calle(?=\s)|avenida|bo?ulevard?|diagonal|pasaje'),
+    ('ROUTE', r'ruta|(rta|rn|rp)(\.|(?=\s))'),
     ('NUM_LABEL_S', r'n\s?[°ºª*]|#|n(?=\d)'),
-    ('NUM_LABEL_L', r'nro[\s.]|n[uú]mero'),
+    ('NUM_LABEL_L', r'nro(\.|(?=\s))|n[uú]mero'),
     ('DECIMAL', r'\d+[.,]\d+'),
     ('NUM_RANGE', r'\d+[/-]\d+([/-]\d+)*'),
-    ('ORDINAL', r'\d+(era?|nd[oa]|[nmtvr][oa])(\s|$|\.)'),
-    ('NUM', r'\d+((\s|$)|[°º])'),
-    ('N', r'n\s'),
-    ('LETTER', r'[^\d\W](\s|$|\.)'),
-    ('NUMS_LETTER', r'[\d]+[^\d\W](\s|$)'),
-    ('WORD', r'[^\s]+'),
-    ('WS', r'\s')
+    ('ORDINAL', r'\d+(era?|nd[oa]|[nmtvr][oa])(\.|(?=\s|$))'),
+    ('NUM', r'\d+([°º]|(?=\s|$))'),
+    ('N', r'n(?=\s)'),
+    ('LETTER', r'[^\d\W](\.|(?=\s|$))'),
+    ('NUMS_LETTER', r'[\d]+[^\d\W](?=\s|$)'),
+    ('WORD', r'[^\s]+')
 ]
 """list: Expresiones regulares utilizadas para crear cada tipo de token en la
-etapa de tokenización.
+etapa de tokenización. Los espacios que delimitan a los tokens se verifican
+utilizando lookaheads (sin consumirlos), de forma que el texto de cada
+coincidencia sea directamente el valor del token. Como ningún otro tipo de
+token puede comenzar con un espacio, 'WS' se ubica primero para que los
+espacios no deban ser comparados contra todas las demás expresiones.
+"""
+
+_TOKEN_REGEXP = re.compile(
+    '|'.join('(?P<{}>{})'.format(*tt) for tt in _TOKEN_TYPES),
+    re.IGNORECASE
+)
+"""_sre.SRE_Pattern: Expresión regular utilizada en la etapa de tokenización,
+compuesta por las expresiones de '_TOKEN_TYPES'. El grupo que coincide con
+cada parte del texto indica el tipo del token.
+"""
+
+# Las expresiones de normalización deben estar antes que la de separación, ya
+# que tienen prioridad sobre ella cuando ambas coinciden en una misma posición.
+_NORMALIZATION_REGEXP = re.compile(
+    '|'.join(_NORMALIZATION_REGEXPS + [_SEPARATION_REGEXP]),
+    re.IGNORECASE
+)
+"""_sre.SRE_Pattern: Expresión regular utilizada en la etapa de normalización.
+Combina las expresiones de '_NORMALIZATION_REGEXPS' y '_SEPARATION_REGEXP',
+para poder normalizar una dirección recorriéndola una sola vez.
+"""
+
+_TYPE_RANKS_WITH_DOOR_NUMBER = {
+    'intersection': 0,
+    'simple': 1,
+    'between': 2
+}
+"""dict: Rango de cada tipo de dirección, utilizado en la etapa de
+desambiguación cuando el árbol de parseo contiene una altura. Los valores más
+altos son mejores.
+"""
+
+_TYPE_RANKS_WITHOUT_DOOR_NUMBER = {
+    'simple': 0,
+    'intersection': 1,
+    'between': 2
+}
+"""dict: Rango de cada tipo de dirección, utilizado en la etapa de
+desambiguación cuando el árbol de parseo no contiene una altura. Los valores
+más altos son mejores.
+"""
+
+_STREET_TYPE_TOKENS = frozenset(['STREET_TYPE_S', 'STREET_TYPE_L'])
+"""frozenset: Tipos de tokens que pueden preceder al nombre de una calle en
+una dirección simple con altura (ver '_is_simple_with_door_number').
+"""
+
+_DOOR_NUMBER_TOKENS = frozenset(['NUM', 'NUM_RANGE', 'DECIMAL'])
+"""frozenset: Tipos de tokens que pueden terminar una dirección simple con
+altura (ver '_is_simple_with_door_number').
+"""
+
+InvalidGrammarException = grammar.InvalidGrammarException
+"""type: Excepción lanzada al cargar una gramática inválida (ver módulo
+grammar.py). Se mantiene disponible en este módulo por compatibilidad.
 """
 
 
-class InvalidGrammarException(Exception):
-    """Excepción lanzada cuando se intenta cargar una gramática con uno o más
-    problemas de estructura.
+def _normalization_replacement(match):
+    """Calcula el reemplazo de una coincidencia de la expresión regular de
+    normalización.
+
+    Si la coincidencia corresponde a '_SEPARATION_REGEXP', se separan las
+    letras del número con un espacio. En caso contrario, la coincidencia
+    corresponde a una de las expresiones de '_NORMALIZATION_REGEXPS', y se
+    reemplaza por un espacio.
+
+    Args:
+        match (_sre.SRE_Match): Coincidencia encontrada.
+
+    Returns:
+        str: Texto a utilizar como reemplazo de la coincidencia.
 
     """
+    letters = match.group('sep_letters')
+    if letters is None:
+        return ' '
 
-    pass
+    return letters + ' ' + match.group('sep_digit')
 
 
-def _with_labels(labels):
-    """Crea un predicado para nltk.Tree que devuelve True si su etiqueta está
-    dentro de un conjunto de valores.
+def _is_simple_with_door_number(token_types):
+    """Determina si una lista de tipos de tokens corresponde a la estructura
+    más común de direcciones: un nombre de calle compuesto solo por palabras
+    (con un tipo de calle opcional al comienzo), seguido de una altura. Por
+    ejemplo:
+
+    'Tucumán 1000'       ---> [WORD, NUM]
+    'Av. Santa Fe 1200'  ---> [STREET_TYPE_S, WORD, WORD, NUM]
+
+    Para estas listas, la gramática genera un único árbol de parseo con
+    altura, de tipo 'simple', y el mismo siempre tiene el mayor rango. Por
+    esta razón, es posible construir las componentes de la dirección sin
+    necesidad de parsear los tokens.
 
     Args:
-        list: Lista de valores.
+        token_types (list): Lista de tipos de tokens.
 
     Returns:
-        function: función que retorna True si el llamado a 'label' de su
-            argumento retorna un objeto que pertenece a un conjunto de valores.
+        bool: True si la lista de tipos de tokens tiene la estructura
+            mencionada.
 
     """
-    return lambda t: t.label() in set(labels)
+    last = len(token_types) - 1
+
+    if last < 1 or token_types[last] not in _DOOR_NUMBER_TOKENS:
+        return False
+
+    start = 1 if token_types[0] in _STREET_TYPE_TOKENS else 0
 
+    # Debe haber al menos una palabra, y todos los tokens entre el comienzo
+    # y la altura deben ser palabras.
+    return last > start and token_types.count('WORD') == last - start
 
-def _load_grammar(grammar_path):
-    """Lee una gramática libre de contexto almacenada en un archivo .cfg y
-    la retorna luego de realizar algunas validaciones.
+
+def _flatten_tree(tree):
+    """Recorre un árbol de parseo una sola vez y genera una lista con
+    información de cada uno de sus nodos (no hojas), en preorden. En el mismo
+    recorrido, se calculan los valores necesarios para obtener el rango del
+    árbol (ver 'TreeVisitor._get_rank').
 
     Args:
-        grammar_path (str): Ruta a un archivo .cfg conteniendo una gramática
-            libre de contexto en el formato utilizado por NLTK.
+        tree (tuple): Árbol de parseo, generado por 'GrammarParser'.
+
+    Returns:
+        tuple: Tupla de tipo (list, int, bool), donde cada valor es la lista
+            de nodos, la cantidad de calles sin nombre y la presencia o no de
+            una altura en el árbol, respectivamente. Cada nodo es una tupla de
+            tipo (str, int, int), donde cada valor es la etiqueta del nodo, el
+            índice de su primera hoja y el índice siguiente a su última hoja,
+            respectivamente.
 
-    Raises:
-        InvalidGrammarException: en caso de que la gramática no sea válida.
+    """
+    nodes = []
+    unnamed_streets = 0
+    has_door_number = False
+    position = 0
+
+    # Recorrer el árbol con una pila explícita (y no de forma recursiva), ya
+    # que los árboles de direcciones con muchos tokens pueden tener una
+    # profundidad mayor al límite de recursión. La pila contiene subárboles
+    # (tuple), hojas (str) e índices de nodos a completar (int), que se
+    # agregan luego de los hijos de cada nodo.
+    stack = [tree]
+
+    while stack:
+        item = stack.pop()
+
+        if isinstance(item, int):
+            # Se terminaron de recorrer los hijos del nodo: completar el
+            # índice siguiente a su última hoja.
+            label, start, _ = nodes[item]
+            nodes[item] = (label, start, position)
+            continue
+
+        if not isinstance(item, tuple):
+            position += 1
+            continue
+
+        label, children = item
+
+        # Los subarboles 'street' solo aparecen debajo de 'street_no_num' y
+        # 'street_with_num', por lo que su primer hijo indica si la calle
+        # tiene nombre o no.
+        if label == 'street_with_num':
+            has_door_number = True
+        elif label == 'street' and children[0][0] == 'unnamed_street':
+            unnamed_streets += 1
+
+        stack.append(len(nodes))
+        nodes.append((label, position, None))
+        stack.extend(reversed(children))
+
+    return nodes, unnamed_streets, has_door_number
+
+
+_grammar_parser = None
+"""GrammarParser: Instancia de GrammarParser compartida por todas las
+instancias de AddressParser del proceso. Se inicializa al crear la primera
+instancia de AddressParser.
+"""
+
+_grammar_parser_lock = threading.Lock()
+"""threading.Lock: Lock utilizado para inicializar '_grammar_parser' una sola
+vez, aun cuando se crean instancias de AddressParser desde varios threads.
+"""
+
+
+def _get_grammar_parser():
+    """Retorna la instancia de GrammarParser compartida, cargando la gramática
+    de direcciones la primera vez que se llama a la función. Como la clase
+    GrammarParser no modifica su estado interno al parsear, una misma
+    instancia puede ser utilizada por varias instancias de AddressParser.
 
     Returns:
-        nltk.CFG: Gramática libre de contexto leída del archivo.
+        GrammarParser: Parser de la gramática de direcciones.
 
     """
-    grammar = nltk.data.load('file:{}'.format(grammar_path))
+    global _grammar_parser  # pylint: disable=global-statement
+
+    if _grammar_parser is None:
+        with _grammar_parser_lock:
+            if _grammar_parser is None:
+                terminals = {token_name for token_name, _ in _TOKEN_TYPES}
+                productions = grammar.load_grammar(
+                    _GRAMMAR_PATH, _START_PRODUCTION, terminals)
+                _grammar_parser = grammar.GrammarParser(productions)
+
+    return _grammar_parser
 
-    if grammar.start().symbol() != _START_PRODUCTION:
-        raise InvalidGrammarException('Start rule must be "{}"'.format(
-            _START_PRODUCTION))
 
-    if not grammar.is_nonempty():
-        raise InvalidGrammarException('Empty productions are not allowed')
+class _TemporaryCache(dict):
+    """Cache de árboles de parseo creado internamente por AddressParser (en
+    'AddressParser.parse_many()' y en cada proceso creado por el mismo), y no
+    especificado por el usuario. Como no es necesario que este cache contenga
+    todas las listas de tipos de tokens procesadas, al utilizarlo se mantiene
+    activo el atajo para direcciones simples con altura (ver
+    '_is_simple_with_door_number').
+
+    """
+
+    pass
 
-    nonterminals = set()
-    terminals = {token_name for token_name, _ in _TOKEN_TYPES}
 
-    for production in grammar.productions():
-        nonterminals.add(production.lhs().symbol())
+_worker_parser = None
+"""AddressParser: Instancia de AddressParser utilizada por cada proceso creado
+en 'AddressParser.parse_many()'. Se inicializa al procesar la primera
+dirección en cada proceso.
+"""
+
+
+def _parse_in_worker(address):
+    """Extrae las componentes de una dirección dentro de un proceso creado por
+    'AddressParser.parse_many()'.
+
+    Args:
+        address (str): Dirección sobre la cual realizar la extracción de
+            componentes.
+
+    Returns:
+        AddressData, NoneType: Ver método 'AddressParser.parse()'.
 
-    for production in grammar.productions():
-        for element in production.rhs():
-            symbol = str(element)
+    """
+    global _worker_parser  # pylint: disable=global-statement
 
-            if nltk.grammar.is_nonterminal(element):
-                if symbol not in nonterminals:
-                    raise InvalidGrammarException(
-                        'Invalid nonterminal: {}'.format(symbol))
-            elif symbol not in terminals:
-                raise InvalidGrammarException(
-                    'Invalid terminal: {}'.format(symbol))
+    if _worker_parser is None:
+        # Cada proceso utiliza su propio cache, ya que los procesos no
+        # comparten memoria entre sí.
+        _worker_parser = AddressParser(cache=_TemporaryCache())
 
-    return grammar
+    return _worker_parser.parse(address)
 
 
 class TreeVisitor:
     """La clase TreeVisitor es utilizada para extraer información útil de
-    instancias de nltk.Tree.
+    árboles de parseo generados por GrammarParser.
+
+    El árbol de parseo se recorre una sola vez, al inicializar el objeto, y no
+    se mantiene una referencia al mismo. De esta forma, las instancias de
+    TreeVisitor almacenadas en un cache ocupan poca memoria. Como los valores
+    calculados al inicializar el objeto nunca se modifican, una misma
+    instancia puede ser utilizada desde varios threads.
 
     Attributes:
-        self._tree: Instancia de nltk.Tree asociada al TreeVisitor. El árbol
-            nunca se modifica en ninguno de los métodos internos utilizados.
-        self._rank: Rango (puntaje) del árbol de parseo contenido en
-            self._tree.
+        self._address_type: Tipo de dirección del árbol de parseo (etiqueta
+            de su raíz).
+        self._unnamed_streets: Cantidad de calles sin nombre en el árbol de
+            parseo, calculada con '_flatten_tree'.
+        self._has_door_number: Presencia o no de una altura en el árbol de
+            parseo, calculada con '_flatten_tree'.
+        self._rank: Rango (puntaje) del árbol de parseo.
+        self._components_leaves_spans: Rangos de índices de hojas de cada
+            componente de dirección (ver '_get_components_leaves_spans').
 
     """
 
-    __slots__ = ['_tree', '_rank', '_components_leaves_indices']
+    __slots__ = [
+        '_address_type',
+        '_unnamed_streets',
+        '_has_door_number',
+        '_rank',
+        '_components_leaves_spans'
+    ]
 
     def __init__(self, tree):
         """Inicializa un objeto de tipo TreeVisitor.
 
         Args:
-            tree (nltk.Tree): Árbol de parseo.
+            tree (tuple): Árbol de parseo.
 
         """
-        self._tree = tree
+        self._address_type = tree[0]
+        nodes, self._unnamed_streets, self._has_door_number = \
+            _flatten_tree(tree)
         self._rank = None
-        self._components_leaves_indices = None
+        self._components_leaves_spans = \
+            self._get_components_leaves_spans(nodes)
 
-    def _get_components_leaves_indices(self):
-        """Retorna listas de índices de hojas por cada componente de dirección
-        en el árbol '_tree'. Es decir, por cada subarbol de interés de '_tree'
-        (por ejemplo, 'floor'), recorre todas sus hojas, y toma nota de sus
-        índices dentro de el arbol completo.
+    def _get_components_leaves_spans(self, nodes):
+        """Retorna rangos de índices de hojas por cada componente de dirección
+        en el árbol de parseo. Es decir, por cada subarbol de interés del árbol
+        (por ejemplo, 'floor'), calcula el índice de su primera hoja y el
+        índice siguiente a su última hoja, dentro de el arbol completo.
 
         Por ejemplo, teniendo el siguiente árbol de parseo (simplificado) para
         los tokens [(SARMIENTO, WORD), (1400, NUM), (2, NUM), (C, LETTER)], de
@@ -199,94 +414,74 @@ class TreeVisitor:
            |               |                  /  \
           WORD            NUM               NUM  LETTER
 
-        Los índices de hojas de cada componentes serían:
-        - street: [0]
-        - door_num_value: [1]
-        - floor: [2, 3]
+        Los rangos de hojas de cada componentes serían:
+        - street: [(0, 1)]
+        - door_num_value: (1, 2)
+        - floor: (2, 4)
 
         La cantidad total de hojas siempre es igual a la cantidad de tokens, ya
         que un árbol de parseo solo es devuelto si cubre la totalidad de los
         tokens especificados.
 
-        Los índices luego son utilizados para acceder a la lista de tokens, y
-        tomar los valores de los mismos. En el ejemplo anterior, los índices
-        [2, 3] resultarían en los valores '2' y 'C', el piso de la dirección.
+        Los rangos luego son utilizados para acceder a la lista de tokens, y
+        tomar los valores de los mismos. En el ejemplo anterior, el rango
+        (2, 4) resultaría en los valores '2' y 'C', el piso de la dirección.
         Notar que para la componente 'street' se arma (potencialmente) más de
-        una lista, ya que puede haber más de una calle en una dirección.
+        un rango, ya que puede haber más de una calle en una dirección.
+
+        Args:
+            nodes (list): Lista de nodos del árbol de parseo, generada con
+                '_flatten_tree'.
 
         Returns:
-            dict: Diccionario con listas de índices de hojas de cada componente
-                de la dirección.
+            dict: Diccionario con rangos (tuplas (int, int)) de índices de
+                hojas de cada componente de la dirección.
 
         """
-        # Operar sobre una copia de _tree para no modificar el árbol original.
-        # La copia se hace una sola vez y no es costosa en comparación a las
-        # otras partes del proceso de parseo.
-        tree = self._tree.copy(deep=True)
-
-        for i, tree_pos in enumerate(tree.treepositions('leaves')):
-            # Modificar nuestro árbol 'tree' para que cada hoja contenga su
-            # propio índice dentro del árbol completo, comenzando desde la
-            # izquierda (anteriormente, cada hoja contenía el tipo de su token
-            # correspondiente en la lista de tokens).
-            tree[tree_pos] = i
-
-        components_leaves_indices = {
+        components_leaves_spans = {
             'street': [],
             'door_number_value': None,
             'door_number_unit': None,
             'floor': None
         }
 
-        condition = _with_labels(components_leaves_indices.keys())
-
-        # Recorrer cada subarbol de interés
-        for subtree in tree.subtrees(condition):
-            label = subtree.label()
-
-            # Tomar la lista de índices de las hojas
-            leaves_indices = subtree.leaves()
-
-            # Almacenar la lista en el diccionario, dependiendo de bajo qué
-            # subarbol estemos
+        # Almacenar el rango de cada subarbol de interés en el diccionario.
+        # Los nodos están en preorden, por lo que las calles se agregan de
+        # izquierda a derecha.
+        for label, start, end in nodes:
             if label == 'street':
-                components_leaves_indices['street'].append(leaves_indices)
-            elif label == 'door_number_value':
-                components_leaves_indices['door_number_value'] = leaves_indices
-            elif label == 'door_number_unit':
-                components_leaves_indices['door_number_unit'] = leaves_indices
-            elif label == 'floor':
-                components_leaves_indices['floor'] = leaves_indices
+                components_leaves_spans['street'].append((start, end))
+            elif label in components_leaves_spans:
+                components_leaves_spans[label] = (start, end)
 
-        return components_leaves_indices
+        return components_leaves_spans
 
-    def _select_token_values(self, tokens, indices):
-        """Dada una lista de tokens, selecciona un subconjunto y retorna sus
-        valores concatenados.
+    def _select_token_values(self, token_values, span):
+        """Dada una lista de valores de tokens, selecciona un subconjunto y lo
+        retorna concatenado.
 
         Args:
-            tokens (list): Lista de tokens. Cada token es una tipla de tipo
-                (str, str), donde el primer string es una parte textual de una
-                dirección, y el segundo es un tipo de token.
-            indices (list): Lista de índices de tokens a seleccionar, en el
-                orden especificado.
+            token_values (list): Lista de valores de tokens. Cada valor es una
+                parte textual de una dirección.
+            span (tuple): Rango (inicio y fin) de índices de tokens a
+                seleccionar.
 
         Returns:
             str: Valor de los tokens concatenados con espacios.
 
         """
-        return ' '.join([tokens[i][0] for i in indices])
+        start, end = span
+        return ' '.join(token_values[start:end])
 
-    def extract_data(self, tokens):
-        """Dada una lista de tokens, utiliza el árbol de parseo interno para
-        determinar a qué componente de dirección pertenece cada token. Luego,
-        se retornan las componentes de dirección construidas a partir de esa
-        información y los valores contenidos dentro de los tokens.
+    def extract_data(self, token_values):
+        """Dada una lista de valores de tokens, utiliza el árbol de parseo
+        interno para determinar a qué componente de dirección pertenece cada
+        token. Luego, se retornan las componentes de dirección construidas a
+        partir de esa información y los valores de los tokens.
 
         Args:
-            tokens (list): Lista de tokens. Cada token es una tipla de tipo
-                (str, str), donde el primer string es una parte textual de una
-                dirección, y el segundo es un tipo de token.
+            token_values (list): Lista de valores de tokens. Cada valor es una
+                parte textual de una dirección.
 
         Returns:
             tuple: Tupla de tipo (list, str, str, str), donde cada valor es la
@@ -294,45 +489,41 @@ class TreeVisitor:
                 altura (unidad) y el piso, respectivamente.
 
         """
-        if not self._components_leaves_indices:
-            # Calcular los índices de las hojas de los árboles de componentes
-            # una sola vez y almacenarlos.
-            self._components_leaves_indices = \
-                self._get_components_leaves_indices()
-
-        # Utilizar _components_leaves_indices para seleccionar los tokens
-        # indicados y construir los valores de las componentes de la dirección.
+        spans = self._components_leaves_spans
+
+        # Utilizar los rangos para seleccionar los tokens indicados y
+        # construir los valores de las componentes de la dirección.
         street_names = [
-            self._select_token_values(tokens, indices)
-            for indices in self._components_leaves_indices['street']
+            self._select_token_values(token_values, span)
+            for span in spans['street']
         ]
 
         door_num_value = None
         door_num_unit = None
         floor = None
 
-        if self._components_leaves_indices['door_number_value']:
+        if spans['door_number_value']:
             door_num_value = self._select_token_values(
-                tokens, self._components_leaves_indices['door_number_value'])
+                token_values, spans['door_number_value'])
 
-        if self._components_leaves_indices['door_number_unit']:
+        if spans['door_number_unit']:
             door_num_unit = self._select_token_values(
-                tokens, self._components_leaves_indices['door_number_unit'])
+                token_values, spans['door_number_unit'])
 
-        if self._components_leaves_indices['floor']:
-            floor = self._select_token_values(
-                tokens, self._components_leaves_indices['floor'])
+        if spans['floor']:
+            floor = self._select_token_values(token_values, spans['floor'])
 
         return street_names, door_num_value, door_num_unit, floor
 
     def _get_rank(self):
-        """Calcula el rango (puntaje) de 'self._tree'. El rango es utilizado
-        en la etapa de desambiguación, para elegir el mejor árbol entre varios.
+        """Calcula el rango (puntaje) del árbol de parseo. El rango es
+        utilizado en la etapa de desambiguación, para elegir el mejor árbol
+        entre varios.
 
         El rango está compuesto de tres valores:
-        - Cantidad de calles sin nombres encontradas en 'self._tree'
-        - La presencia o no de una altura en 'self._tree' (1 o 0)
-        - Rango del tipo de dirección encontrado en 'self._tree'
+        - Cantidad de calles sin nombres encontradas en el árbol
+        - La presencia o no de una altura en el árbol (1 o 0)
+        - Rango del tipo de dirección encontrado en el árbol
 
         El significado de cada valor se explica más en detalle en el archivo
         docs/design.md.
@@ -342,42 +533,30 @@ class TreeVisitor:
                 mejores.
 
         """
-        has_door_number = False
-        unnamed_streets = 0
-
-        condition = _with_labels(['street_no_num', 'street_with_num'])
-
-        # Recorrer cada subarbol de interés
-        for subtree in self._tree.subtrees(condition):
-            if subtree.label() == 'street_with_num':
-                has_door_number = True
-
-            if subtree[0][0].label() == 'unnamed_street':
-                unnamed_streets += 1
-
-        # La presencia o no de una altura afecta el rango del tipo de la
-        # dirección
-        if has_door_number:
-            ranks = ['intersection', 'simple', 'between']
+        # La cantidad de calles sin nombre y la presencia o no de una altura
+        # ya fueron calculadas al recorrer el árbol en '_flatten_tree'. La
+        # presencia o no de una altura afecta el rango del tipo de la
+        # dirección.
+        if self._has_door_number:
+            rank = _TYPE_RANKS_WITH_DOOR_NUMBER[self.address_type]
         else:
-            ranks = ['simple', 'intersection', 'between']
+            rank = _TYPE_RANKS_WITHOUT_DOOR_NUMBER[self.address_type]
 
-        rank = ranks.index(self.address_type)
-
-        return (unnamed_streets, int(has_door_number), rank)
+        return (self._unnamed_streets, int(self._has_door_number), rank)
 
     @property
     def rank(self):
-        # Cachear el rango para evitar calcularlo varias veces. Como el valor
-        # de self._tree nunca se modifica, esto no puede traer problemas.
-        if not self._rank:
+        # Cachear el rango para evitar calcularlo varias veces. Como los
+        # valores utilizados nunca se modifican, esto no puede traer
+        # problemas.
+        if self._rank is None:
             self._rank = self._get_rank()
 
         return self._rank
 
     @property
     def address_type(self):
-        return self._tree.label()
+        return self._address_type
 
 
 class AddressParser:
@@ -394,48 +573,50 @@ class AddressParser:
     'Tucumán 1000' ---> [WORD, INT]
     'Córdoba 2000' ---> [WORD, INT]
 
+    También se puede especificar un segundo cache, para evitar procesar una
+    misma dirección (string) más de una vez. En este caso, se reutilizan
+    directamente las componentes extraídas previamente, sin necesidad de
+    normalizar, tokenizar ni parsear la dirección nuevamente.
+
     Notar que si no se especifica un cache, la clase AddressParser tiene un
     estado interno completamente inmutable. Por el otro lado, el uso de cache
     aumenta considerablemente la performance del proceso de extracción.
 
     Attributes:
-        _parser (nltk.EarleyChartParser): Instancia de parser Earley utilizado
-            en la etapa de parseo.
-        _token_regexp (_sre.SRE_Pattern): Expresión regular utilizada en la
-            generación de tokens.
-        _separation_regexp (_sre.SRE_Pattern): Expresión regular utilizada en
-            la etapa de normalización (separación de letras y números).
-        _normalization_regexp (_sre.SRE_Pattern): Expresión regular utilizada
-            en la etapa de normalización.
+        _parser (GrammarParser): Instancia de parser utilizado en la etapa de
+            parseo, compartida por todas las instancias de AddressParser.
         _cache (dict): Objeto dict-like utilizado para cachear árboles de
             parseo. Puede ser 'None' (no utilizar cache).
+        _address_cache (dict): Objeto dict-like utilizado para cachear las
+            componentes extraídas de cada dirección. Puede ser 'None' (no
+            utilizar cache).
+        _simple_shortcut (bool): Indica si se deben procesar las direcciones
+            simples con altura sin parsear sus tokens. Es 'False' solo cuando
+            el usuario especificó un cache de árboles de parseo, ya que en ese
+            caso el mismo debe contener todas las listas de tipos de tokens
+            procesadas.
 
     """
 
-    def __init__(self, cache=None):
+    def __init__(self, cache=None, address_cache=None):
         """Inicializa un objecto de tipo AddressParser.
 
         Args:
             cache (dict): Ver atributo 'self._cache'.
+            address_cache (dict): Ver atributo 'self._address_cache'.
 
         """
-        self._parser = nltk.EarleyChartParser(_load_grammar(_GRAMMAR_PATH))
-
-        self._token_regexp = re.compile(
-            '|'.join('(?P<{}>{})'.format(*tt) for tt in _TOKEN_TYPES),
-            re.IGNORECASE)
-
-        self._separation_regexp = re.compile(_SEPARATION_REGEXP, re.IGNORECASE)
-
-        self._normalization_regexp = re.compile(
-            '|'.join(_NORMALIZATION_REGEXPS),
-            re.IGNORECASE
-        )
+        self._parser = _get_grammar_parser()
 
         self._cache = cache
+        self._address_cache = address_cache
+        self._simple_shortcut = cache is None or \
+            isinstance(cache, _TemporaryCache)
 
     def _tokenize_address(self, address):
-        """Genera una lista de tokens a partir de una potencial dirección.
+        """Genera los tokens de una potencial dirección. Los valores y los
+        tipos de los tokens se retornan en dos listas separadas (generadas en
+        una sola pasada), ya que la etapa de parseo solo utiliza los tipos.
 
         Args:
             address (str): Dirección normalizada.
@@ -445,20 +626,22 @@ class AddressParser:
                 UNKNOWN.
 
         Returns:
-            list: Lista de tokens. Cada token es de tipo tuple (str, str),
-                donde el primer string es una parte textual de la dirección, y
-                el segundo es el tipo del token.
+            tuple: Tupla de tipo (list, list). La primera lista contiene los
+                valores de los tokens (partes textuales de la dirección), y la
+                segunda sus tipos, en el mismo orden.
 
         """
-        tokens = []
-        for mo in self._token_regexp.finditer(address):
+        token_values = []
+        token_types = []
+
+        for mo in _TOKEN_REGEXP.finditer(address):
             kind = mo.lastgroup
-            value = mo.group().strip()
 
             if kind != 'WS':
-                tokens.append((value, kind))
+                token_values.append(mo.group())
+                token_types.append(kind)
 
-        return tokens
+        return token_values, token_types
 
     def _normalize_address(self, address):
         """Normaliza una dirección, removiendo partes del texto que no son de
@@ -471,47 +654,61 @@ class AddressParser:
             str: Dirección normalizada.
 
         """
-        # Reemplazar partes no deseadas por espacios
-        normalized = self._normalization_regexp.sub(' ', address.strip())
-
-        # Separar dos o más letras pegadas a números (en ese orden):
-        # Sí: 'hola123' -> 'hola 123'
-        # Sí: 'ruta nac.3' -> 'ruta nac. 3'
-        # No: '1ro de Mayo' -> '1ro de Mayo'
-        # No: 'Lote 14 M2' -> 'Lote 14 M2'
-        normalized = self._separation_regexp.sub(r'\1 \2', normalized)
+        # En una sola pasada:
+        # - Reemplazar partes no deseadas por espacios
+        # - Separar dos o más letras pegadas a números (en ese orden):
+        #   Sí: 'hola123' -> 'hola 123'
+        #   Sí: 'ruta nac.3' -> 'ruta nac. 3'
+        #   No: '1ro de Mayo' -> '1ro de Mayo'
+        #   No: 'Lote 14 M2' -> 'Lote 14 M2'
+        normalized = _NORMALIZATION_REGEXP.sub(_normalization_replacement,
+                                               address.strip())
 
         # Normalizar espacios (también remueve trailing/leading whitespace)
         return ' '.join(normalized.split())
 
     def _disambiguate_trees(self, visitors):
-        """Dada una lista de árboles de parseo, toma el mejor utilizando el
-        rango de cada uno como criterio de decisión. Para ver más detalles de
-        la etapa de desambiguación, ver el archivo docs/design.md.
+        """Dada una secuencia de árboles de parseo, toma el mejor utilizando
+        el rango de cada uno como criterio de decisión. Para ver más detalles
+        de la etapa de desambiguación, ver el archivo docs/design.md.
+
+        Los árboles se recorren una sola vez, manteniendo solo el mejor
+        TreeVisitor y el segundo mejor rango encontrados hasta el momento.
 
         Args:
-            visitors (list): Lista de TreeVisitor.
+            visitors (iterable): Secuencia de TreeVisitor.
 
         Returns:
             TreeVisitor, NoneType: Se retorna el mejor TreeVisitor si se pudo
                 encontrar uno inequívocamente, o None si no fue posible.
 
         """
-        if len(visitors) == 1:
-            return visitors[0]
+        best = None
+        second_rank = None
+
+        for visitor in visitors:
+            if best is None:
+                # Si hay un solo árbol, no es necesario calcular su rango.
+                best = visitor
+                continue
+
+            rank = visitor.rank
 
-        visitors.sort(key=lambda v: v.rank, reverse=True)
+            if rank > best.rank:
+                second_rank = best.rank
+                best = visitor
+            elif second_rank is None or rank > second_rank:
+                second_rank = rank
 
-        # La lista de árboles ahora está ordenada de mejor a peor. Comparar
-        # el rango (puntaje) del primer elemento con el del segundo: si son
-        # iguales, entonces hay dos o más árboles con el mismo rango
+        # Comparar el rango (puntaje) del mejor árbol con el del segundo: si
+        # son iguales, entonces hay dos o más árboles con el mismo rango
         # maximal. Esto quiere decir que todos estos árboles son una
         # solución viable, pero no es posible distinguir cuál de ellos es
         # el más adecuado. Si sucede esto, devolver None.
-        if visitors[0].rank == visitors[1].rank:
+        if second_rank is not None and best.rank == second_rank:
             return None
 
-        return visitors[0]
+        return best
 
     def _tokens_parse_tree(self, token_types):
         """Dada una lista de *tipos* de tokens, retorna el mejor árbol de
@@ -525,14 +722,14 @@ class AddressParser:
                 no existe.
 
         """
-        visitors = [
-            # tree[0] toma el subárbol debajo de la producción 'address'
-            TreeVisitor(tree[0])
+        visitors = (
+            # tree[1][0] toma el subárbol debajo de la producción 'address'
+            TreeVisitor(tree[1][0])
             for tree in
             self._parser.parse(token_types)
-        ]
+        )
 
-        return self._disambiguate_trees(visitors) if visitors else None
+        return self._disambiguate_trees(visitors)
 
     def _parse_token_types(self, token_types):
         """El método '_parse_token_types' es simplemente un wrapper de
@@ -549,20 +746,26 @@ class AddressParser:
 
         """
         if self._cache is not None:
-            tokens_hash = hash(tuple(token_types))
-
-            if tokens_hash in self._cache:
-                return self._cache[tokens_hash]
+            # Utilizar la tupla de tipos como clave (y no su hash), para que
+            # dos listas distintas nunca compartan una misma entrada.
+            key = tuple(token_types)
+
+            # Realizar una sola consulta al cache (y no 'in' seguido de una
+            # lectura), ya que un cache acotado compartido entre threads
+            # podría remover la clave entre ambas operaciones.
+            try:
+                return self._cache[key]
+            except KeyError:
+                pass
 
             tree = self._tokens_parse_tree(token_types)
-            self._cache[tokens_hash] = tree
+            self._cache[key] = tree
             return tree
 
         return self._tokens_parse_tree(token_types)
 
-    def parse(self, address):
-        """Punto de entrada de la clase AddressParser. Toma una dirección como
-        string e intenta extraer sus componentes, utilizando el proceso
+    def _extract_components(self, address):
+        """Extrae las componentes de una dirección, utilizando el proceso
         detallado en el archivo docs/design.md.
 
         Args:
@@ -570,9 +773,11 @@ class AddressParser:
                 componentes.
 
         Returns:
-            AddressData, NoneType: Si se pudieron extraer las componente
-                con éxito, se retorna una instancia de 'AddressData' con los
-                valores apropiados. En caso contrario se retorna 'None'.
+            tuple, NoneType: Tupla de tipo (str, tuple, tuple, str), donde cada
+                valor es el tipo de la dirección, los nombres de calles
+                encontrados, la altura (valor y unidad) y el piso,
+                respectivamente. Si no se pudieron extraer las componentes, se
+                retorna 'None'.
 
         """
         # 1) Normalizar
@@ -582,19 +787,123 @@ class AddressParser:
             return None
 
         # 2) Tokenizar
-        tokens = self._tokenize_address(processed)
+        token_values, token_types = self._tokenize_address(processed)
+
+        if self._simple_shortcut and _is_simple_with_door_number(token_types):
+            # Caso más común: evitar las etapas 3, 4 y 5, ya que el resultado
+            # de las mismas es conocido de antemano. Si el usuario especificó
+            # un cache, se lo consulta normalmente (el costo de hacerlo es
+            # similar).
+            return ('simple', (' '.join(token_values[:-1]),),
+                    (token_values[-1], None), None)
 
         # 3) Parsear y 4) Desambiguar
-        visitor = self._parse_token_types([
-            t_type for _, t_type in tokens
-        ])
+        visitor = self._parse_token_types(token_types)
 
         if not visitor:
             return None
 
         # 5) Ensamblar
         street_names, door_number_value, door_number_unit, floor = \
-            visitor.extract_data(tokens)
+            visitor.extract_data(token_values)
+
+        return (visitor.address_type, tuple(street_names),
+                (door_number_value, door_number_unit), floor)
+
+    def _parse_components(self, address):
+        """El método '_parse_components' es simplemente un wrapper de
+        '_extract_components' que utiliza 'self._address_cache' para evitar
+        procesar una misma dirección más de una vez (si no es 'None').
+
+        Args:
+            address (str): Dirección sobre la cual realizar la extracción de
+                componentes.
+
+        Returns:
+            tuple, NoneType: Ver método '_extract_components'.
+
+        """
+        if self._address_cache is not None:
+            # Ver comentario en '_parse_token_types'.
+            try:
+                return self._address_cache[address]
+            except KeyError:
+                pass
+
+            components = self._extract_components(address)
+            self._address_cache[address] = components
+            return components
+
+        return self._extract_components(address)
+
+    def parse(self, address):
+        """Punto de entrada de la clase AddressParser. Toma una dirección como
+        string e intenta extraer sus componentes, utilizando el proceso
+        detallado en el archivo docs/design.md.
+
+        Args:
+            address (str): Dirección sobre la cual realizar la extracción de
+                componentes.
+
+        Returns:
+            AddressData, NoneType: Si se pudieron extraer las componente
+                con éxito, se retorna una instancia de 'AddressData' con los
+                valores apropiados. En caso contrario se retorna 'None'.
+
+        """
+        components = self._parse_components(address)
+
+        if not components:
+            return None
+
+        address_type, street_names, door_number, floor = components
+
+        # Crear una nueva lista de calles por cada llamado, ya que los valores
+        # almacenados en 'self._address_cache' no deben ser modificados.
+        return AddressData(address_type, list(street_names), door_number,
+                           floor)
+
+    def parse_many(self, addresses, processes=None, chunksize=256):
+        """Extrae las componentes de varias direcciones. Opcionalmente, el
+        procesamiento se puede distribuir entre varios procesos, para
+        aprovechar más de un núcleo del procesador.
+
+        Si no se especificó un cache de árboles de parseo, se utiliza uno
+        temporal durante el procesamiento de las direcciones, de forma que
+        cada lista de tipos de tokens distinta se parsee una sola vez. Las
+        direcciones simples con altura se siguen procesando sin parsear sus
+        tokens, al igual que en 'parse()'.
+
+        Al utilizar más de un proceso, cada uno crea su propia instancia de
+        AddressParser (con su propio cache de árboles de parseo), por lo que
+        los caches especificados en 'self' no son utilizados.
+
+        Args:
+            addresses (iterable): Direcciones sobre las cuales realizar la
+                extracción de componentes.
+            processes (int): Cantidad de procesos a utilizar. Si es 'None' o
+                menor a 2, las direcciones se procesan en el proceso actual.
+            chunksize (int): Cantidad de direcciones enviadas a cada proceso
+                por vez.
+
+        Returns:
+            list: Lista de valores retornados por el método 'parse()' (de tipo
+                AddressData o NoneType) para cada dirección, en el mismo
+                orden.
+
+        """
+        if not processes or processes < 2:
+            parser = self
+
+            if self._cache is None:
+                # Utilizar un parser con un cache temporal, para no modificar
+                # el estado interno de 'self'.
+                parser = AddressParser(cache=_TemporaryCache(),
+                                       address_cache=self._address_cache)
+
+            return [parser.parse(address) for address in addresses]
 
-        return AddressData(visitor.address_type, street_names,
-                           (door_number_value, door_number_unit), floor)
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=processes) as executor:
+            return list(executor.map(_parse_in_worker, addresses,
+                                     chunksize=chunksize))
@@ -0,0 +1,667 @@
+"""Módulo grammar.py de georef-ar-address
+
+Contiene clases y funciones utilizadas para leer gramáticas libres de contexto
+almacenadas en archivos .cfg, y para parsear listas de tipos de tokens
+utilizando las mismas.
+
+Para ver información sobre el uso de la gramática en el proceso de extracción
+de componentes de direcciones, ver el archivo docs/design.md.
+
+"""
+
+import re
+import math
+import itertools
+import collections
+
+_GRAMMAR_SYMBOL_REGEXP = re.compile(
+    r'''(?P<terminal>'[^']+'|"[^"]+")'''
+    r'|(?P<nonterminal>\w+)'
+    r'|(?P<arrow>->)'
+    r'|(?P<separator>\|)'
+    r'|(?P<comment>#.*)'
+    r'|(?P<invalid>\S+)'
+)
+"""_sre.SRE_Pattern: Expresión regular utilizada para leer los elementos de
+cada línea de un archivo .cfg. Como los terminales se leen antes que los
+comentarios, un '#' entre comillas es considerado parte de un terminal.
+"""
+
+
+class InvalidGrammarException(Exception):
+    """Excepción lanzada cuando se intenta cargar una gramática con uno o más
+    problemas de estructura.
+
+    """
+
+    pass
+
+
+def read_grammar(grammar_path):
+    """Lee las producciones de una gramática libre de contexto almacenada en
+    un archivo .cfg.
+
+    El formato del archivo es un subconjunto del utilizado por NLTK: cada
+    línea contiene una producción de tipo 'lhs -> rhs', donde el lado derecho
+    puede contener varias alternativas separadas por '|'. Los terminales se
+    escriben entre comillas, y el texto luego de un '#' (fuera de un terminal)
+    es ignorado. No se admiten directivas como '%start': la producción
+    inicial es siempre la primera del archivo.
+
+    Args:
+        grammar_path (str): Ruta al archivo .cfg.
+
+    Raises:
+        InvalidGrammarException: en caso de encontrar una línea con sintaxis
+            inválida.
+
+    Returns:
+        list: Lista de producciones, en el orden en el que aparecen en el
+            archivo. Cada producción es una tupla de tipo (str, tuple), donde
+            el primer valor es el no terminal del lado izquierdo y el segundo
+            el lado derecho. Cada lado derecho es una tupla de elementos
+            (str, bool), donde el primer valor es el símbolo y el segundo
+            indica si el símbolo es terminal.
+
+    """
+    productions = []
+
+    with open(grammar_path, encoding='utf-8') as grammar_file:
+        for line_number, line in enumerate(grammar_file, 1):
+            if line.lstrip().startswith('%'):
+                raise InvalidGrammarException(
+                    'Unsupported directive (line {}): {}'.format(
+                        line_number, line.strip()))
+
+            symbols = [
+                mo for mo in _GRAMMAR_SYMBOL_REGEXP.finditer(line)
+                if mo.lastgroup != 'comment'
+            ]
+
+            if not symbols:
+                continue
+
+            if len(symbols) < 2 or symbols[0].lastgroup != 'nonterminal' or \
+               symbols[1].lastgroup != 'arrow':
+                raise InvalidGrammarException(
+                    'Invalid production (line {}): {}'.format(line_number,
+                                                              line.strip()))
+
+            lhs = symbols[0].group()
+            rhs = []
+
+            for mo in symbols[2:]:
+                kind = mo.lastgroup
+
+                if kind == 'separator':
+                    productions.append((lhs, tuple(rhs)))
+                    rhs = []
+                elif kind == 'terminal':
+                    rhs.append((mo.group()[1:-1], True))
+                elif kind == 'nonterminal':
+                    rhs.append((mo.group(), False))
+                else:
+                    raise InvalidGrammarException(
+                        'Invalid symbol (line {}): {}'.format(line_number,
+                                                              mo.group()))
+
+            productions.append((lhs, tuple(rhs)))
+
+    return productions
+
+
+def load_grammar(grammar_path, start_production, terminals):
+    """Lee una gramática libre de contexto almacenada en un archivo .cfg y
+    la retorna luego de realizar algunas validaciones.
+
+    Args:
+        grammar_path (str): Ruta a un archivo .cfg conteniendo una gramática
+            libre de contexto en el formato utilizado por NLTK.
+        start_production (str): No terminal de la producción inicial, que
+            debe ser el lado izquierdo de la primera producción.
+        terminals (set): Conjunto de terminales (tipos de tokens) válidos.
+
+    Raises:
+        InvalidGrammarException: en caso de que la gramática no sea válida.
+
+    Returns:
+        list: Lista de producciones de la gramática (ver 'read_grammar'). La
+            primera producción corresponde a la producción inicial.
+
+    """
+    productions = read_grammar(grammar_path)
+
+    if not productions or productions[0][0] != start_production:
+        raise InvalidGrammarException('Start rule must be "{}"'.format(
+            start_production))
+
+    if not all(rhs for _, rhs in productions):
+        raise InvalidGrammarException('Empty productions are not allowed')
+
+    nonterminals = {lhs for lhs, _ in productions}
+
+    # Separar los elementos de los lados derechos de las producciones en
+    # terminales y no terminales, y compararlos con los conjuntos válidos.
+    elements = {element for _, rhs in productions for element in rhs}
+    used_nonterminals = {
+        symbol
+        for symbol, is_terminal in elements
+        if not is_terminal
+    }
+    used_terminals = {
+        symbol
+        for symbol, is_terminal in elements
+        if is_terminal
+    }
+
+    invalid_nonterminals = used_nonterminals - nonterminals
+    if invalid_nonterminals:
+        raise InvalidGrammarException('Invalid nonterminal: {}'.format(
+            min(invalid_nonterminals)))
+
+    invalid_terminals = used_terminals - terminals
+    if invalid_terminals:
+        raise InvalidGrammarException('Invalid terminal: {}'.format(
+            min(invalid_terminals)))
+
+    _check_unit_cycles(productions)
+    _check_productive(productions)
+
+    return productions
+
+
+def _check_unit_cycles(productions):
+    """Comprueba que una gramática no contenga ciclos de producciones
+    unitarias (por ejemplo, 'a -> b' y 'b -> a'). Estos ciclos permitirían
+    generar infinitos árboles de parseo para una misma lista de tokens.
+
+    Args:
+        productions (list): Lista de producciones de la gramática (ver
+            'read_grammar').
+
+    Raises:
+        InvalidGrammarException: en caso de que la gramática contenga un ciclo
+            de producciones unitarias.
+
+    """
+    unit_children = {}
+
+    for lhs, rhs in productions:
+        if len(rhs) == 1 and not rhs[0][1]:
+            unit_children.setdefault(lhs, set()).add(rhs[0][0])
+
+    def visit(symbol, path):
+        if symbol in path:
+            raise InvalidGrammarException(
+                'Unit production cycle found: {}'.format(symbol))
+
+        for child in unit_children.get(symbol, ()):
+            visit(child, path | {symbol})
+
+    for symbol in unit_children:
+        visit(symbol, frozenset())
+
+
+def _check_productive(productions):
+    """Comprueba que todos los no terminales de una gramática puedan generar
+    al menos una lista finita de tokens. Por ejemplo, un no terminal cuya
+    única producción es "a -> 'NUM' a" no puede hacerlo. Estos no terminales
+    nunca forman parte de un árbol de parseo, y no tienen una cantidad mínima
+    de tokens definida (ver '_min_lengths').
+
+    Args:
+        productions (list): Lista de producciones de la gramática (ver
+            'read_grammar').
+
+    Raises:
+        InvalidGrammarException: en caso de que la gramática contenga un no
+            terminal improductivo.
+
+    """
+    rhss = {}
+
+    for lhs, rhs in productions:
+        rhss.setdefault(lhs, []).append(rhs)
+
+    unproductive = [
+        symbol
+        for symbol, length in _min_lengths(rhss).items()
+        if length == math.inf
+    ]
+
+    if unproductive:
+        raise InvalidGrammarException('Unproductive nonterminal: {}'.format(
+            min(unproductive)))
+
+
+_RhsElement = collections.namedtuple('_RhsElement', [
+    'symbol',
+    'is_terminal',
+    'first_set',
+    'last_set',
+    'min_length',
+    'max_length',
+    'rest_min_length',
+    'rest_max_length',
+    'next_first_set'
+])
+"""type: Elemento del lado derecho de una producción, compilado por
+GrammarParser. Además del símbolo, contiene información precalculada que
+permite acotar los rangos de tokens que el elemento puede cubrir: los tipos de
+tokens con los que puede comenzar y terminar, las cantidades mínima y máxima
+de tokens que cubre, las cantidades mínima y máxima de tokens que cubren los
+elementos siguientes, y los tipos de tokens con los que puede comenzar el
+elemento siguiente ('None' si es el último).
+"""
+
+
+def _edge_terminals(rhss, position):
+    """Calcula, para cada no terminal, el conjunto de terminales que pueden
+    aparecer en un extremo (primera o última posición) de sus derivaciones.
+    Como la gramática no contiene producciones vacías, solo es necesario
+    considerar el elemento del extremo de cada lado derecho.
+
+    Args:
+        rhss (dict): Diccionario de no terminal a lista de lados derechos de
+            sus producciones.
+        position (int): Índice del elemento a considerar en cada lado
+            derecho: 0 para el comienzo, -1 para el final.
+
+    Returns:
+        dict: Diccionario de no terminal a conjunto de terminales
+            (frozenset).
+
+    """
+    terminals = {symbol: set() for symbol in rhss}
+    changed = True
+
+    # Iterar hasta llegar a un punto fijo
+    while changed:
+        changed = False
+
+        for symbol, symbol_rhss in rhss.items():
+            for rhs in symbol_rhss:
+                element, is_terminal = rhs[position]
+                edge = {element} if is_terminal else terminals[element]
+
+                if not edge <= terminals[symbol]:
+                    terminals[symbol] |= edge
+                    changed = True
+
+    return {
+        symbol: frozenset(symbol_terminals)
+        for symbol, symbol_terminals in terminals.items()
+    }
+
+
+def _min_lengths(rhss):
+    """Calcula, para cada no terminal, la menor cantidad de tokens que puede
+    cubrir una de sus derivaciones.
+
+    Args:
+        rhss (dict): Diccionario de no terminal a lista de lados derechos de
+            sus producciones.
+
+    Returns:
+        dict: Diccionario de no terminal a cantidad de tokens (int).
+
+    """
+    lengths = {symbol: math.inf for symbol in rhss}
+    changed = True
+
+    # Iterar hasta llegar a un punto fijo
+    while changed:
+        changed = False
+
+        for symbol, symbol_rhss in rhss.items():
+            for rhs in symbol_rhss:
+                length = sum(
+                    1 if is_terminal else lengths[element]
+                    for element, is_terminal in rhs
+                )
+
+                if length < lengths[symbol]:
+                    lengths[symbol] = length
+                    changed = True
+
+    return lengths
+
+
+def _max_lengths(rhss):
+    """Calcula, para cada no terminal, la mayor cantidad de tokens que puede
+    cubrir una de sus derivaciones. Como la gramática no contiene producciones
+    vacías ni ciclos de producciones unitarias, un no terminal desde el cual se
+    puede alcanzar un ciclo de producciones no tiene cota (math.inf).
+
+    Args:
+        rhss (dict): Diccionario de no terminal a lista de lados derechos de
+            sus producciones.
+
+    Returns:
+        dict: Diccionario de no terminal a cantidad de tokens (int o
+            math.inf).
+
+    """
+    lengths = {}
+
+    def visit(symbol, path):
+        if symbol in path:
+            return math.inf
+
+        if symbol not in lengths:
+            lengths[symbol] = max(
+                sum(
+                    1 if is_terminal else visit(element, path | {symbol})
+                    for element, is_terminal in rhs
+                )
+                for rhs in rhss[symbol]
+            )
+
+        return lengths[symbol]
+
+    for symbol in rhss:
+        visit(symbol, frozenset())
+
+    return lengths
+
+
+class GrammarParser:
+    """Parser de gramáticas libres de contexto, especializado para la
+    gramática de direcciones utilizada por AddressParser.
+
+    Al inicializarse, las producciones de la gramática se compilan a un
+    diccionario indexado por no terminal. Luego, el parseo se realiza
+    calculando (de forma recursiva y memoizada) todos los árboles posibles para
+    cada no terminal y rango de tokens necesario, comenzando por la producción
+    inicial y la lista de tokens completa.
+
+    Como la gramática no contiene producciones vacías ni ciclos de producciones
+    unitarias, cada no terminal se visita como máximo una vez por rango de
+    tokens, y se generan exactamente los mismos árboles que generaría un
+    parser de tipo chart, evitando el costo de construir el chart.
+
+    Para evitar considerar rangos de tokens que no pueden ser parseados, cada
+    elemento de las producciones compiladas incluye las cantidades mínima y
+    máxima de tokens que puede cubrir, y los tipos de tokens con los que
+    pueden comenzar y terminar sus derivaciones (ver '_RhsElement'). Solo se
+    intenta parsear un elemento en un rango si el mismo respeta esas cotas.
+    De esta forma, las producciones recursivas (por ejemplo, un nombre de
+    calle con muchas palabras) se parsean en tiempo lineal con respecto a la
+    cantidad de tokens.
+
+    Los árboles de parseo se representan con tuplas de tipo (str, tuple),
+    donde el primer valor es la etiqueta del nodo y el segundo la tupla de sus
+    hijos. Cada hijo es a su vez un árbol, o un str (tipo de token) en el caso
+    de las hojas.
+
+    Los no terminales con recursión a izquierda (por ejemplo, 'a -> a B') se
+    parsean primero en los rangos más cortos, de forma que la profundidad de
+    la recursión no dependa de la cantidad de tokens.
+
+    El estado de cada parseo se almacena en una instancia de '_ParseChart',
+    por lo que una misma instancia de GrammarParser puede ser utilizada desde
+    varios threads.
+
+    Attributes:
+        _start (str): Símbolo de la producción inicial.
+        _productions (dict): Diccionario de no terminal a lista de lados
+            derechos de sus producciones. Cada lado derecho es una tupla de
+            elementos de tipo '_RhsElement'.
+        _first_set (frozenset): Tipos de tokens con los que puede comenzar
+            una derivación de la producción inicial.
+        _last_set (frozenset): Tipos de tokens con los que puede terminar
+            una derivación de la producción inicial.
+        _left_recursive (frozenset): No terminales con al menos una producción
+            que comienza con el mismo no terminal.
+
+    """
+
+    __slots__ = [
+        '_start',
+        '_productions',
+        '_first_set',
+        '_last_set',
+        '_left_recursive'
+    ]
+
+    def __init__(self, productions):
+        """Inicializa un objeto de tipo GrammarParser.
+
+        Args:
+            productions (list): Lista de producciones de la gramática,
+                validada con 'load_grammar'.
+
+        """
+        self._start = productions[0][0]
+        rhss = {}
+
+        for lhs, rhs in productions:
+            rhss.setdefault(lhs, []).append(rhs)
+
+        first_sets = _edge_terminals(rhss, 0)
+        last_sets = _edge_terminals(rhss, -1)
+        min_lengths = _min_lengths(rhss)
+        max_lengths = _max_lengths(rhss)
+
+        # Información de cada elemento posible de un lado derecho: conjuntos
+        # de primeros y últimos terminales, y cantidades mínima y máxima de
+        # tokens cubiertos.
+        elements = {
+            (symbol, False): (first_sets[symbol], last_sets[symbol],
+                              min_lengths[symbol], max_lengths[symbol])
+            for symbol in rhss
+        }
+
+        for symbol_rhss in rhss.values():
+            for symbol, is_terminal in itertools.chain(*symbol_rhss):
+                if is_terminal:
+                    terminal_set = frozenset([symbol])
+                    elements[(symbol, True)] = (terminal_set, terminal_set,
+                                                1, 1)
+
+        self._productions = {
+            lhs: [self._compile_rhs(rhs, elements) for rhs in symbol_rhss]
+            for lhs, symbol_rhss in rhss.items()
+        }
+
+        self._first_set = first_sets[self._start]
+        self._last_set = last_sets[self._start]
+        self._left_recursive = frozenset(
+            lhs
+            for lhs, symbol_rhss in rhss.items()
+            if any(rhs[0] == (lhs, False) for rhs in symbol_rhss)
+        )
+
+    def _compile_rhs(self, rhs, elements):
+        """Compila el lado derecho de una producción, agregando a cada
+        elemento la información necesaria para acotar los rangos de tokens que
+        puede cubrir.
+
+        Args:
+            rhs (tuple): Lado derecho de una producción (ver 'read_grammar').
+            elements (dict): Diccionario de elemento (str, bool) a tupla de
+                tipo (frozenset, frozenset, int, int), con los conjuntos de
+                primeros y últimos terminales, y las cantidades mínima y
+                máxima de tokens que cubre el elemento.
+
+        Returns:
+            tuple: Tupla de elementos de tipo '_RhsElement'.
+
+        """
+        compiled = []
+        rest_min_length = 0
+        rest_max_length = 0
+        next_first_set = None
+
+        # Recorrer los elementos de derecha a izquierda, acumulando las
+        # cantidades de tokens de los elementos siguientes.
+        for element in reversed(rhs):
+            first_set, last_set, min_length, max_length = elements[element]
+            compiled.append(_RhsElement(element[0], element[1], first_set,
+                                        last_set, min_length, max_length,
+                                        rest_min_length, rest_max_length,
+                                        next_first_set))
+
+            rest_min_length += min_length
+            rest_max_length += max_length
+            next_first_set = first_set
+
+        return tuple(reversed(compiled))
+
+    def parse(self, token_types):
+        """Retorna todos los árboles de parseo posibles para una lista de
+        tipos de tokens, utilizando la producción inicial de la gramática.
+
+        Args:
+            token_types (list): Lista de tipos de tokens.
+
+        Returns:
+            list: Lista de árboles de parseo (tuple). Si la lista de tokens
+                no puede ser parseada, se retorna una lista vacía.
+
+        """
+        if not token_types or token_types[0] not in self._first_set or \
+           token_types[-1] not in self._last_set:
+            return []
+
+        chart = _ParseChart(self._productions, self._left_recursive,
+                            token_types)
+        return chart.parse_symbol(self._start, 0, len(token_types))
+
+
+class _ParseChart:
+    """Estado de un parseo realizado por GrammarParser: la lista de tipos de
+    tokens y los árboles ya calculados para cada no terminal y rango de
+    tokens. Se crea una instancia por cada llamado a 'GrammarParser.parse()'.
+
+    Attributes:
+        _productions (dict): Producciones compiladas de la gramática (ver
+            atributo 'GrammarParser._productions').
+        _left_recursive (frozenset): No terminales con recursión a izquierda
+            (ver atributo 'GrammarParser._left_recursive').
+        _token_types (list): Lista de tipos de tokens.
+        _trees (dict): Diccionario utilizado para memoizar los árboles de
+            cada no terminal y rango, indexado por tuplas de tipo
+            (str, int, int).
+
+    """
+
+    __slots__ = ['_productions', '_left_recursive', '_token_types', '_trees']
+
+    def __init__(self, productions, left_recursive, token_types):
+        """Inicializa un objeto de tipo _ParseChart.
+
+        Args:
+            productions (dict): Ver atributo '_productions'.
+            left_recursive (frozenset): Ver atributo '_left_recursive'.
+            token_types (list): Ver atributo '_token_types'.
+
+        """
+        self._productions = productions
+        self._left_recursive = left_recursive
+        self._token_types = token_types
+        self._trees = {}
+
+    def parse_symbol(self, symbol, start, end):
+        """Retorna todos los árboles de parseo de un no terminal que cubren
+        exactamente un rango de tokens.
+
+        Args:
+            symbol (str): No terminal.
+            start (int): Índice del primer token del rango.
+            end (int): Índice siguiente al último token del rango.
+
+        Returns:
+            list: Lista de árboles de parseo (tuple).
+
+        """
+        key = (symbol, start, end)
+        trees = self._trees.get(key)
+
+        if trees is None:
+            if symbol in self._left_recursive:
+                # Calcular primero los rangos más cortos con el mismo
+                # comienzo: de esta forma, la recursión a izquierda siempre
+                # encuentra el rango anterior ya calculado.
+                for split in range(start + 1, end):
+                    if (symbol, start, split) not in self._trees:
+                        self._trees[(symbol, start, split)] = \
+                            self._symbol_trees(symbol, start, split)
+
+            trees = self._symbol_trees(symbol, start, end)
+            self._trees[key] = trees
+
+        return trees
+
+    def _symbol_trees(self, symbol, start, end):
+        """Calcula todos los árboles de parseo de un no terminal que cubren
+        exactamente un rango de tokens, sin memoizar el resultado. Ver método
+        'parse_symbol'.
+
+        Args:
+            symbol (str): No terminal.
+            start (int): Índice del primer token del rango.
+            end (int): Índice siguiente al último token del rango.
+
+        Returns:
+            list: Lista de árboles de parseo (tuple).
+
+        """
+        return [
+            (symbol, children)
+            for rhs in self._productions[symbol]
+            for children in self._parse_rhs(rhs, 0, start, end)
+        ]
+
+    def _parse_rhs(self, rhs, index, start, end):
+        """Genera todas las listas de hijos posibles para los elementos de un
+        lado derecho de una producción (a partir del elemento 'index'), que
+        cubren exactamente un rango de tokens.
+
+        Args:
+            rhs (tuple): Lado derecho compilado de una producción.
+            index (int): Índice del primer elemento de 'rhs' a considerar.
+            start (int): Índice del primer token del rango.
+            end (int): Índice siguiente al último token del rango.
+
+        Yields:
+            tuple: Tupla de hijos (tuple o str) para los elementos.
+
+        """
+        element = rhs[index]
+        token_types = self._token_types
+
+        if token_types[start] not in element.first_set:
+            return
+
+        # Posiciones posibles para el final del elemento, según la cantidad
+        # de tokens que pueden cubrir el mismo y los elementos siguientes.
+        lowest = max(start + element.min_length,
+                     end - element.rest_max_length)
+        highest = min(start + element.max_length,
+                      end - element.rest_min_length)
+
+        for split in range(lowest, highest + 1):
+            if token_types[split - 1] not in element.last_set or \
+               split < end and \
+               token_types[split] not in element.next_first_set:
+                continue
+
+            if element.is_terminal:
+                heads = (element.symbol,)
+            else:
+                heads = self.parse_symbol(element.symbol, start, split)
+
+            if not heads:
+                continue
+
+            if split == end:
+                for head in heads:
+                    yield (head,)
+                continue
+
+            tails = list(self._parse_rhs(rhs, index + 1, split, end))
+
+            for head in heads:
+                for tail in tails:
+                    yield (head,) + tail
@@ -0,0 +1,113 @@
+"""Módulo lru_cache.py de georef-ar-address
+
+Contiene la clase 'LRUCache', un objeto dict-like de tamaño acotado que puede
+ser utilizado como cache por la clase 'AddressParser'.
+
+"""
+
+import collections
+import collections.abc
+
+
+class LRUCache(collections.abc.MutableMapping):
+    """Objeto dict-like con una cantidad máxima de elementos. Al agregar un
+    elemento nuevo cuando el objeto está lleno, se remueve el elemento
+    utilizado (leído o escrito) menos recientemente.
+
+    Permite utilizar los caches de 'AddressParser' en procesos de larga
+    duración sin que su uso de memoria crezca indefinidamente.
+
+    Las siguientes operaciones actualizan el orden de uso de los elementos:
+    'cache[key]', 'cache[key] = value', y los métodos que las utilizan
+    internamente ('get()', 'setdefault()', 'update()', 'items()' y
+    'values()'). Las operaciones 'key in cache', 'len(cache)' y la iteración
+    de las claves no lo modifican. Como la iteración se realiza sobre una
+    copia de las claves, es posible leer los elementos mientras se itera.
+
+    Attributes:
+        _max_size (int): Cantidad máxima de elementos.
+        _items (collections.OrderedDict): Elementos almacenados, ordenados
+            desde el utilizado menos recientemente al utilizado más
+            recientemente.
+
+    """
+
+    __slots__ = ['_max_size', '_items']
+
+    def __init__(self, max_size):
+        """Inicializa un objeto de tipo LRUCache.
+
+        Args:
+            max_size (int): Ver atributo '_max_size'.
+
+        Raises:
+            ValueError: Si el tamaño máximo no es positivo.
+
+        """
+        if max_size < 1:
+            raise ValueError('Invalid cache size: {}'.format(max_size))
+
+        self._max_size = max_size
+        self._items = collections.OrderedDict()
+
+    def __getitem__(self, key):
+        value = self._items[key]
+        self._items.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._items[key] = value
+        self._items.move_to_end(key)
+
+        if len(self._items) > self._max_size:
+            # Remover el elemento utilizado menos recientemente
+            self._items.popitem(last=False)
+
+    def __delitem__(self, key):
+        del self._items[key]
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __reduce__(self):
+        # Permite utilizar 'pickle', 'copy.copy' y 'copy.deepcopy',
+        # conservando el orden de uso de los elementos.
+        return self.__class__, (self._max_size,), None, None, \
+            iter(list(self._items.items()))
+
+    def __repr__(self):
+        return 'LRUCache({}, {})'.format(self._max_size, dict(self._items))
+
+    def clear(self):
+        self._items.clear()
+
+    def copy(self):
+        """Retorna una copia del objeto, con el mismo tamaño máximo y los
+        mismos elementos (en el mismo orden de uso).
+
+        Returns:
+            LRUCache: Copia del objeto.
+
+        """
+        copied = self.__class__(self._max_size)
+
+        for key, value in self._items.items():
+            copied[key] = value
+
+        return copied
+
+    @property
+    def max_size(self):
+        """Getter para el atributo '_max_size'.
+
+        Returns:
+            int: Cantidad máxima de elementos.
+
+        """
+        return self._max_size
@@ -24,7 +24,7 @@ setup(
     python_requires='>=3',
     url='https://github.com/datosgobar/georef-ar-address',
     download_url='https://github.com/datosgobar/georef-ar-address/archive/{}.tar.gz'.format(VERSION),
-    keywords=['georef', 'datos', 'argentina', 'direccion', 'calle', 'altura', 'json', 'nltk'],
+    keywords=['georef', 'datos', 'argentina', 'direccion', 'calle', 'altura', 'json'],
     license='MIT',
     classifiers=[
         'Programming Language :: Python :: 3 :: Only',
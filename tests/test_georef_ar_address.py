@@ -1,11 +1,20 @@
+import copy
 import json
 import os
+import pickle
+import tempfile
 import unittest
+from unittest import mock
 import logging
-from georef_ar_address import AddressParser, ADDRESS_TYPES
+from georef_ar_address import AddressParser, ADDRESS_TYPES, LRUCache
+from georef_ar_address import grammar
+
+
+def setUpModule():
+    # Configurar logging al ejecutar los tests, y no al importar el módulo.
+    logging.basicConfig(format='%(message)s',
+                        level=os.environ.get('LOG_LEVEL', 'ERROR'))
 
-logging.basicConfig(format='%(message)s',
-                    level=os.environ.get('LOG_LEVEL', 'ERROR'))
 
 ADDRESS_DATA_TEMPLATE = {
     'street_names': [],
@@ -21,6 +30,25 @@ def test_file_path(filename):
     return os.path.join(os.path.dirname(__file__), filename)
 
 
+def load_test_cases(filename):
+    """Lee un archivo JSON de test cases, removiendo los campos '_comment'
+    de cada test case.
+
+    Args:
+        filename (str): Ruta al archivo JSON.
+
+    Returns:
+        list: Lista de test cases (dict).
+
+    """
+    with open(filename, encoding='utf-8') as f:
+        return [
+            {key: value for key, value in test_case.items()
+             if key != '_comment'}
+            for test_case in json.load(f)
+        ]
+
+
 class CachedAddresParserTest(unittest.TestCase):
     def test_address_parser_cache(self):
         """Al utilizar un cache, se debería agregar una key por cada
@@ -54,6 +82,124 @@ class CachedAddresParserTest(unittest.TestCase):
 
         self.assertEqual(len(cache), 1)
 
+    def test_address_parser_address_cache(self):
+        """Al utilizar un cache de direcciones, se debería agregar una key por
+        cada dirección distinta, y los resultados deberían ser los mismos que
+        al no utilizar cache."""
+        address_cache = {}
+        parser = AddressParser(address_cache=address_cache)
+        uncached_parser = AddressParser()
+        addresses = [
+            'Corrientes 1000',
+            'Tucumán 2000',
+            'Corrientes 1000',
+            'Tucumán y Córdoba y Callao'
+        ]
+
+        for address in addresses:
+            data = parser.parse(address)
+            expected = uncached_parser.parse(address)
+
+            if expected:
+                self.assertEqual(data.to_dict(), expected.to_dict())
+            else:
+                self.assertIsNone(data)
+
+        self.assertEqual(len(address_cache), len(set(addresses)))
+
+    def test_address_parser_address_cache_copies(self):
+        """Al utilizar un cache de direcciones, modificar los valores
+        retornados no debería modificar los valores cacheados."""
+        parser = AddressParser(address_cache={})
+
+        parser.parse('Corrientes y Tucumán').street_names.append('Callao')
+        data = parser.parse('Corrientes y Tucumán')
+
+        self.assertEqual(data.street_names, ['Corrientes', 'Tucumán'])
+
+
+class LRUCacheTest(unittest.TestCase):
+    def test_lru_cache_max_size(self):
+        """Al agregar elementos a un cache lleno, se debería remover el
+        elemento utilizado menos recientemente."""
+        cache = LRUCache(2)
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertEqual(cache['a'], 1)
+        cache['c'] = 3
+
+        self.assertEqual(list(cache.keys()), ['a', 'c'])
+
+    def test_lru_cache_get(self):
+        """Leer un elemento con 'get()' debería actualizar su orden de uso,
+        y consultar su presencia con 'in' no."""
+        cache = LRUCache(2)
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIn('b', cache)
+        cache['c'] = 3
+
+        self.assertEqual(list(cache), ['a', 'c'])
+
+    def test_lru_cache_read_while_iterating(self):
+        """Debería ser posible leer los elementos mientras se itera sobre
+        las claves, sin modificar su orden final."""
+        cache = LRUCache(3)
+        cache.update([('a', 1), ('b', 2), ('c', 3)])
+
+        self.assertEqual({key: cache[key] for key in cache},
+                         {'a': 1, 'b': 2, 'c': 3})
+        self.assertEqual(list(cache), ['a', 'b', 'c'])
+
+    def test_lru_cache_copies(self):
+        """Las copias del cache deberían conservar el tamaño máximo, los
+        elementos y su orden de uso."""
+        cache = LRUCache(2)
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertEqual(cache['a'], 1)
+
+        copies = [
+            cache.copy(),
+            copy.copy(cache),
+            copy.deepcopy(cache),
+            pickle.loads(pickle.dumps(cache))
+        ]
+
+        for copied in copies:
+            self.assertEqual(copied.max_size, 2)
+            self.assertEqual(list(copied), ['b', 'a'])
+            copied['c'] = 3
+            self.assertEqual(list(copied), ['a', 'c'])
+
+        self.assertEqual(list(cache), ['b', 'a'])
+
+    def test_address_parser_lru_cache(self):
+        """Al utilizar un cache acotado, la cantidad de keys nunca debería
+        superar su tamaño máximo, y los resultados deberían ser los mismos
+        que al no utilizar cache."""
+        cache = LRUCache(2)
+        parser = AddressParser(cache=cache, address_cache=LRUCache(2))
+        uncached_parser = AddressParser()
+        addresses = [
+            'Corrientes 1000',
+            'Santa fe 2000 3 A',
+            'callle 10 123 y Tucumán',
+            'Corrientes 1000'
+        ]
+
+        for address in addresses:
+            data = parser.parse(address)
+            expected = uncached_parser.parse(address)
+            self.assertEqual(data.to_dict(), expected.to_dict())
+            self.assertLessEqual(len(cache), 2)
+
+    def test_invalid_max_size(self):
+        """Un tamaño máximo menor a 1 debería resultar en una excepción."""
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+
 
 class AddressParserTest(unittest.TestCase):
     @classmethod
@@ -61,11 +207,7 @@ class AddressParserTest(unittest.TestCase):
         cls._parser = AddressParser()
 
         filename = cls._test_file  # pylint: disable=no-member
-        with open(filename) as f:
-            cls._test_cases = json.load(f)
-
-        for test_case in cls._test_cases:
-            test_case.pop('_comment', None)
+        cls._test_cases = load_test_cases(filename)
 
         assert all(
             test_case['type'] in ADDRESS_TYPES or test_case['type'] is None
@@ -101,11 +243,16 @@ class AddressParserTest(unittest.TestCase):
         ]
 
         for test_case in test_cases:
-            for key in ADDRESS_DATA_TEMPLATE:
-                if key not in test_case:
-                    test_case[key] = ADDRESS_DATA_TEMPLATE[key]
+            # Completar los campos faltantes sin modificar el test case
+            # original, utilizando valores mutables nuevos cada vez.
+            expected = {
+                **ADDRESS_DATA_TEMPLATE,
+                'street_names': [],
+                'door_number': {'value': None, 'unit': None},
+                **test_case
+            }
 
-            self.assert_address_data(test_case['address'], test_case)
+            self.assert_address_data(test_case['address'], expected)
 
     def assert_address_data(self, address, data):
         parsed = self._parser.parse(address).to_dict()
@@ -151,9 +298,102 @@ class RealAddressParserTest(AddressParserTest):
         self.assert_cases_for_type('between')
 
 
-class InvalidAddressesParserTest(unittest.TestCase):
+class ParseManyTest(unittest.TestCase):
     def setUp(self):
         self.parser = AddressParser()
+        self.addresses = [
+            'Corrientes 1000',
+            'Tucumán y Córdoba y Callao',
+            'Tucuman e/ Corrientes y Salta 1000',
+            ''
+        ]
+
+    def assert_same_results(self, results):
+        self.assertEqual(len(results), len(self.addresses))
+
+        for address, data in zip(self.addresses, results):
+            expected = self.parser.parse(address)
+
+            if expected:
+                self.assertEqual(data.to_dict(), expected.to_dict())
+            else:
+                self.assertIsNone(data)
+
+    def test_parse_many(self):
+        """Los resultados de 'parse_many()' deberían ser los mismos que los
+        de 'parse()' para cada dirección."""
+        self.assert_same_results(self.parser.parse_many(self.addresses))
+
+    def test_parse_many_repeated_structures(self):
+        """Al utilizar 'parse_many()' sin un cache, cada lista de tipos de
+        tokens distinta debería ser parseada una sola vez por llamado (y las
+        direcciones simples con altura ninguna), y los resultados deberían ser
+        los mismos que los de 'parse()'."""
+        self.addresses = [
+            'Corrientes 1000',
+            'Tucumán 2000',
+            'Córdoba y Callao',
+            'Salta y Jujuy',
+            'Corrientes 1000'
+        ]
+
+        with mock.patch.object(grammar.GrammarParser, 'parse', autospec=True,
+                               side_effect=grammar.GrammarParser.parse) as \
+                parse_mock:
+            for _ in range(2):
+                parse_mock.reset_mock()
+                results = self.parser.parse_many(self.addresses)
+
+                parsed = [tuple(call[0][1])
+                          for call in parse_mock.call_args_list]
+                self.assertEqual(parsed, [('WORD', 'AND_WORD', 'WORD')])
+
+        self.assert_same_results(results)
+
+    def test_parse_many_processes(self):
+        """Los resultados de 'parse_many()' utilizando varios procesos
+        deberían ser los mismos que los de 'parse()' para cada dirección."""
+        results = self.parser.parse_many(self.addresses, processes=2,
+                                         chunksize=1)
+        self.assert_same_results(results)
+
+
+class SimpleAddressShortcutTest(unittest.TestCase):
+    def test_simple_addresses_without_parsing(self):
+        """Las direcciones simples con altura procesadas sin parsear los
+        tokens deberían tener las mismas componentes que al parsearlos."""
+        parser = AddressParser()
+        cached_parser = AddressParser(cache={})
+        addresses = [
+            'Corrientes 1000',
+            'Av. Santa Fe 1200',
+            'Avenida de Mayo 1370',
+            'Pasaje Los Andes Sur 1324/1326',
+            'Ruta 3 km 20',
+            'Tucumán 1500 2ndo A'
+        ]
+
+        for address in addresses:
+            data = parser.parse(address)
+            expected = cached_parser.parse(address)
+            self.assertEqual(data.to_dict(), expected.to_dict())
+
+
+class LongAddressTest(unittest.TestCase):
+    def test_long_street_name(self):
+        """Una dirección con muchos tokens debería poder ser parseada sin
+        superar el límite de recursión."""
+        address = ' '.join(['Tucumán'] * 1000)
+        data = AddressParser().parse(address)
+
+        self.assertEqual(data.type, 'simple')
+        self.assertEqual(data.street_names, [address])
+
+
+class InvalidAddressesParserTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = AddressParser()
 
     def test_empty_address(self):
         """Un string vacío como dirección debería resultar en None."""
@@ -167,8 +407,9 @@ class InvalidAddressesParserTest(unittest.TestCase):
 
 
 class DoorNumberValueTest(unittest.TestCase):
-    def setUp(self):
-        self.parser = AddressParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = AddressParser()
 
     def test_int_door_number_value(self):
         """Una dirección con altura numérica en forma de número entero debería
@@ -194,10 +435,24 @@ class DoorNumberValueTest(unittest.TestCase):
         data = self.parser.parse('Leandro Alem S/N')
         self.assertIsNone(data.normalized_door_number_value())
 
+    def test_door_number_value_repeated(self):
+        """Llamar varias veces a 'normalized_door_number_value()' debería
+        retornar siempre el mismo valor, incluso luego de copiar el objeto."""
+        data = self.parser.parse('Ruta provincial 4 km 32,5')
+        copied_before = copy.copy(data)
+        value = data.normalized_door_number_value()
+        self.assertAlmostEqual(value, 32.5)
+        self.assertEqual(data.normalized_door_number_value(), value)
+
+        for copied in [copied_before, pickle.loads(pickle.dumps(data))]:
+            self.assertEqual(copied.normalized_door_number_value(), value)
+            self.assertEqual(copied.normalized_door_number_unit(), 'km')
+
 
 class DoorNumberUnitTest(unittest.TestCase):
-    def setUp(self):
-        self.parser = AddressParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = AddressParser()
 
     def test_int_door_number_unit_none(self):
         """Una dirección con altura sin prefijo debería devolver None en
@@ -216,3 +471,78 @@ class DoorNumberUnitTest(unittest.TestCase):
         'normalized_door_number_unit()'."""
         data = self.parser.parse('Ruta 33 KM. 33')
         self.assertEqual(data.normalized_door_number_unit(), 'km')
+
+
+class GrammarTest(unittest.TestCase):
+    def load_grammar(self, text, terminals=('WORD', 'NUM')):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'grammar.cfg')
+
+            with open(path, 'w', encoding='utf-8') as grammar_file:
+                grammar_file.write(text)
+
+            return grammar.load_grammar(path, 'address', set(terminals))
+
+    def test_read_grammar(self):
+        """Las producciones leídas deberían incluir cada alternativa del lado
+        derecho, ignorando comentarios."""
+        productions = self.load_grammar(
+            '# Comentario\n'
+            'address -> street | street \'NUM\'  # Comentario\n'
+            'street -> \'WORD\'\n'
+        )
+
+        self.assertEqual(productions, [
+            ('address', (('street', False),)),
+            ('address', (('street', False), ('NUM', True))),
+            ('street', (('WORD', True),))
+        ])
+
+    def test_read_grammar_quoted_comment_character(self):
+        """Un '#' entre comillas debería ser leído como un terminal, y no
+        como el comienzo de un comentario."""
+        productions = self.load_grammar(
+            "address -> '#' 'NUM'  # Comentario\n", terminals=('#', 'NUM'))
+
+        self.assertEqual(productions, [
+            ('address', (('#', True), ('NUM', True)))
+        ])
+
+    def test_start_directive(self):
+        """Una gramática con una directiva '%start' debería resultar en una
+        excepción, ya que la producción inicial es siempre la primera."""
+        with self.assertRaises(grammar.InvalidGrammarException):
+            self.load_grammar("%start address\naddress -> 'WORD'\n")
+
+    def test_invalid_terminal(self):
+        """Una gramática con un terminal que no es un tipo de token debería
+        resultar en una excepción."""
+        with self.assertRaises(grammar.InvalidGrammarException):
+            self.load_grammar("address -> 'FOO'\n")
+
+    def test_invalid_nonterminal(self):
+        """Una gramática con un no terminal sin producciones debería resultar
+        en una excepción."""
+        with self.assertRaises(grammar.InvalidGrammarException):
+            self.load_grammar("address -> street 'NUM'\n")
+
+    def test_invalid_syntax(self):
+        """Una gramática con una línea sin '->' debería resultar en una
+        excepción."""
+        with self.assertRaises(grammar.InvalidGrammarException):
+            self.load_grammar("address 'NUM'\n")
+
+    def test_unproductive_nonterminal(self):
+        """Una gramática con un no terminal que no puede generar una lista
+        finita de tokens debería resultar en una excepción."""
+        with self.assertRaises(grammar.InvalidGrammarException):
+            self.load_grammar(
+                "address -> 'WORD' street | 'WORD' 'NUM'\n"
+                "street -> 'NUM' street\n")
+
+    def test_unit_production_cycle(self):
+        """Una gramática con un ciclo de producciones unitarias debería
+        resultar en una excepción."""
+        with self.assertRaises(grammar.InvalidGrammarException):
+            self.load_grammar(
+                "address -> street\nstreet -> address | 'WORD'\n")
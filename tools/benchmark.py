@@ -1,33 +1,97 @@
+import os
+import statistics
+import time
 import timeit
 from georef_ar_address import AddressParser
 
-ITERATIONS = 500
+REPEAT = 5
+
+PARALLEL_ADDRESSES = 100000
+
+ADDRESSES = [
+    'Tucuman',
+    'Tucuman 1000',
+    'Tucuman Nro 1000',
+    'Tucuman Nro 1000 2 c',
+    'Tucuman y Salta',
+    'Tucuman y Salta 1000',
+    'Tucuman 1000 y Salta',
+    'Tucuman e/ Corrientes y Salta',
+    'Tucuman e/ Corrientes y Salta 1000',
+    'Tucuman 1000 e/ Corrientes y Salta'
+]
+
+
+def run_benchmark(test_fn):
+    # Procesar las direcciones una vez antes de medir, para que la primera
+    # muestra no incluya costos de inicialización (por ejemplo, la carga de
+    # la gramática).
+    test_fn()
+
+    # Elegir una cantidad de iteraciones que tome al menos 0.2 segundos, y
+    # luego tomar varias muestras con esa cantidad.
+    timer = timeit.Timer(stmt=test_fn)
+    iterations, _ = timer.autorange()
+    samples = [
+        result / iterations
+        for result in timer.repeat(repeat=REPEAT, number=iterations)
+    ]
+
+    best = min(samples)
+
+    print('- Iteraciones:   {} x {}'.format(iterations, REPEAT))
+    print('- Por iteración: {0:.7f} (mínimo)'.format(best))
+    print('- Por iteración: {0:.7f} (mediana)'.format(
+        statistics.median(samples)))
+    print('- Por iteración: {0:.7f} (desvío)'.format(
+        statistics.stdev(samples)))
+    print('- Por dirección: {0:.7f} (mínimo)'.format(best / len(ADDRESSES)))
 
 
 def benchmark(use_cache):
     parser = AddressParser({} if use_cache else None)
 
     def test_fn():
-        parser.parse('Tucuman')
-        parser.parse('Tucuman 1000')
-        parser.parse('Tucuman Nro 1000')
-        parser.parse('Tucuman Nro 1000 2 c')
-        parser.parse('Tucuman y Salta')
-        parser.parse('Tucuman y Salta 1000')
-        parser.parse('Tucuman 1000 y Salta')
-        parser.parse('Tucuman e/ Corrientes y Salta')
-        parser.parse('Tucuman e/ Corrientes y Salta 1000')
-        parser.parse('Tucuman 1000 e/ Corrientes y Salta')
-
-    result = timeit.timeit(stmt=test_fn, number=ITERATIONS)
+        for address in ADDRESSES:
+            parser.parse(address)
+
+    run_benchmark(test_fn)
+
+
+def benchmark_batch():
+    # Sin cache, 'parse_many()' utiliza un cache temporal en cada llamado, y
+    # mantiene el atajo para direcciones simples con altura. Como todas las
+    # direcciones de ADDRESSES tienen estructuras distintas, el resultado
+    # debería ser similar al de 'Sin Cache' (y nunca mayor).
+    parser = AddressParser()
+
+    def test_fn():
+        parser.parse_many(ADDRESSES)
+
+    run_benchmark(test_fn)
+
+
+def benchmark_parallel(processes):
+    # Cada proceso crea su propio AddressParser, con su propio cache.
+    parser = AddressParser()
+    addresses = ADDRESSES * (PARALLEL_ADDRESSES // len(ADDRESSES))
+
+    start = time.perf_counter()
+    parser.parse_many(addresses, processes=processes)
+    result = time.perf_counter() - start
 
+    print('- Procesos:      {}'.format(processes))
     print('- Total:         {0:.7f}'.format(result))
-    print('- Por iteración: {0:.7f}'.format(result / ITERATIONS))
-    print('- Por dirección: {0:.7f}'.format((result / ITERATIONS) / 10))
+    print('- Direcciones/s: {0:.0f}'.format(len(addresses) / result))
 
 
 if __name__ == '__main__':
+    print('(Mediciones realizadas luego de procesar cada dirección una vez)')
     print('Sin Cache:')
     benchmark(False)
     print('Con Cache:')
     benchmark(True)
+    print('Sin Cache, en lote (parse_many):')
+    benchmark_batch()
+    print('Con Cache, en paralelo:')
+    benchmark_parallel(max(os.cpu_count() or 1, 2))